@@ -10,7 +10,10 @@ setup(
         "sqlalchemy",
         "psycopg2-binary",
         "python-dotenv",
-        "beautifulsoup4",
+        "dateparser",
+        "selectolax",
+        "orjson",
+        "httpx[http2]",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
 ) 
\ No newline at end of file
@@ -1,25 +1,87 @@
-from sqlalchemy import create_engine, Column, String, DateTime, Text, Boolean, UUID, JSON, Integer, Float
+from sqlalchemy import create_engine, event, Column, String, DateTime, Text, Boolean, UUID, JSON, Integer, Float, text, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
+import logging
 import os
-from dotenv import load_dotenv
 import uuid
+from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Create database engine
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://localhost:5432/headhunter")
-engine = create_engine(DATABASE_URL)
+
+# Under pytest-xdist each worker process gets its own SQLite file so
+# parallel test runs never contend on one database.
+_xdist_worker = os.getenv("PYTEST_XDIST_WORKER")
+if _xdist_worker and DATABASE_URL.startswith("sqlite:///"):
+    DATABASE_URL = f"{DATABASE_URL}.{_xdist_worker}"
+
+# psycopg2 fast-execution helpers: pack many rows into each INSERT round-trip
+# instead of one statement per row. Page sizes are kept moderate because wide
+# rows (raw_data JSON) make each row expensive to buffer.
+#
+# Pool sizing covers ingest bursts from concurrent scrapers: enough persistent
+# connections for all writers plus overflow headroom, recycled before typical
+# server-side idle timeouts. Pre-ping stays off (an extra round-trip per
+# checkout) and READ COMMITTED is pinned so bulk writers never pay for a
+# stricter isolation level.
+engine_kwargs = {}
+if DATABASE_URL.startswith("postgresql"):
+    engine_kwargs.update(
+        executemany_mode="values_plus_batch",
+        executemany_batch_page_size=500,
+        insertmanyvalues_page_size=1000,
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=1800,
+        pool_pre_ping=False,
+        isolation_level="READ COMMITTED",
+    )
+elif DATABASE_URL.startswith("sqlite"):
+    # Tests share the engine across threads (the metrics writer runs on
+    # its own daemon thread); sqlite connections are safe for that as long
+    # as the pool serializes access.
+    engine_kwargs["connect_args"] = {"check_same_thread": False}
+engine = create_engine(DATABASE_URL, **engine_kwargs)
+
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL avoids rewriting the whole journal per commit, and NORMAL
+        # drops the fsync-per-commit that dominates batched test inserts;
+        # both are safe for throwaway test databases.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
 
 # Create base class for models
 Base = declarative_base()
 
+# JSONB on PostgreSQL stores a binary representation that is TOAST-compressed
+# and skips re-parsing on read; other dialects fall back to plain JSON.
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+# Server-side UUIDs keep id generation off the per-row Python path on
+# PostgreSQL; other dialects (the tests' per-worker SQLite files) have no
+# gen_random_uuid(), so they fall back to a client-side default.
+if DATABASE_URL.startswith("postgresql"):
+    def _uuid_primary_key():
+        return Column(UUID, primary_key=True, server_default=text("gen_random_uuid()"))
+else:
+    def _uuid_primary_key():
+        return Column(UUID, primary_key=True, default=uuid.uuid4)
+
 class Job(Base):
     __tablename__ = "jobs"
 
-    id = Column(UUID, primary_key=True, default=uuid.uuid4)
+    id = _uuid_primary_key()
     title = Column(String, nullable=False)
     company = Column(String, nullable=False)
     location = Column(String)
@@ -34,8 +96,16 @@ class Job(Base):
 
 class IndeedJob(Base):
     __tablename__ = "indeed_jobs"
+    # Recency queries (run scripts order by scraped_at desc) should not
+    # force sequential scans that fight the batch inserter. date_posted is
+    # BRIN-indexed: rows arrive in roughly posting order, so a block-range
+    # index gives cheap recency filters at a fraction of a btree's size.
+    __table_args__ = (
+        Index('ix_indeed_jobs_scraped_at', 'scraped_at'),
+        Index('ix_indeed_jobs_date_posted', 'date_posted', postgresql_using='brin'),
+    )
 
-    id = Column(UUID, primary_key=True, default=uuid.uuid4)
+    id = _uuid_primary_key()
     job_id = Column(String, unique=True)  # Indeed's unique job ID
     title = Column(String, nullable=False)
     company = Column(String, nullable=False)
@@ -52,16 +122,18 @@ class IndeedJob(Base):
     company_rating = Column(String)  # Company rating if available
     company_reviews_count = Column(String)  # Number of company reviews
     company_website = Column(String)  # Company website if available
-    benefits = Column(JSON)  # JSON array of benefits
-    raw_data = Column(JSON)  # Store complete raw data for future processing
+    benefits = Column(JSONVariant)  # JSON array of benefits
+    raw_data = Column(JSONVariant)  # Store complete raw data for future processing
     
     def __repr__(self):
         return f"<IndeedJob(title='{self.title}', company='{self.company}')>"
 
 class StackOverflowJob(Base):
     __tablename__ = "stackoverflow_jobs"
+    # view_recent_jobs filters and orders on scraped_at.
+    __table_args__ = (Index('ix_stackoverflow_jobs_scraped_at', 'scraped_at'),)
 
-    id = Column(UUID, primary_key=True, default=uuid.uuid4)
+    id = _uuid_primary_key()
     job_id = Column(String)  # Stack Overflow's internal job ID
     title = Column(String)
     company = Column(String)
@@ -73,16 +145,16 @@ class StackOverflowJob(Base):
     salary_range = Column(String, nullable=True)
     job_type = Column(String, nullable=True)  # Full-time, Contract, etc.
     experience_level = Column(String, nullable=True)
-    tags = Column(JSON, nullable=True)  # Store job tags/technologies
+    tags = Column(JSONVariant, nullable=True)  # Store job tags/technologies
     company_size = Column(String, nullable=True)
     company_industry = Column(String, nullable=True)
     remote_work = Column(Boolean, nullable=True)
-    raw_data = Column(JSON)  # Store complete raw data for future processing
+    raw_data = Column(JSONVariant)  # Store complete raw data for future processing
 
 class ScrapingMetrics(Base):
     __tablename__ = "scraping_metrics"
 
-    id = Column(UUID, primary_key=True, default=uuid.uuid4)
+    id = _uuid_primary_key()
     scraper_name = Column(String, nullable=False)
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=True)
@@ -100,6 +172,19 @@ class ScrapingMetrics(Base):
     def __repr__(self):
         return f"<ScrapingMetrics(scraper='{self.scraper_name}', duration={self.total_duration:.2f}s)>"
 
+# gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it on
+# older servers. Generating ids server-side keeps them off the wire and out
+# of the per-row Python path during bulk inserts. CREATE EXTENSION needs
+# privileges the app role may not have, so a failure is logged rather than
+# raised — on PG >= 13 the function exists without the extension anyway.
+if DATABASE_URL.startswith("postgresql"):
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pgcrypto"))
+            conn.commit()
+    except Exception as e:
+        logger.warning(f"Could not ensure pgcrypto extension: {str(e)}")
+
 # Create all tables
 Base.metadata.create_all(engine)
 
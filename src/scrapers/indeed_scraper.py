@@ -1,14 +1,16 @@
-from playwright.sync_api import sync_playwright, TimeoutError
-import time
-import random
+from playwright.async_api import async_playwright, TimeoutError
+import asyncio
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
-import os
 from dotenv import load_dotenv
-import uuid
-import json
+import re
+import dateparser
+from selectolax.lexbor import LexborHTMLParser
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from database.models import IndeedJob, SessionLocal
+from utils.rate_limiter import AsyncRateLimiter
 
 # Configure logging
 logging.basicConfig(
@@ -17,292 +19,566 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of jobs to accumulate before flushing to the database. Keeps memory
+# bounded while amortizing transaction overhead across many rows.
+DB_BATCH_SIZE = 1000
+
+# In-flight detail fetches per page worker. The fetches overlap network
+# latency; the shared rate limiter still spaces the requests themselves.
+DETAIL_CONCURRENCY = 4
+
+# Resource types and tracker domains the scraper never consumes; aborting
+# them cuts page-load time and bandwidth without affecting extraction.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+BLOCKED_URL_FRAGMENTS = ("googletagmanager", "doubleclick", "google-analytics", "segment.io")
+
+# Extracts every card on the list page in one call: the detail URL plus the
+# list-level fields, so Python can decide per card whether a detail fetch is
+# even needed without another round-trip.
+_CARD_LIST_JS = """() => [...document.querySelectorAll(
+    "div.job_seen_beacon, div[data-testid='job-card']"
+)].map(c => ({
+    url: c.querySelector('h2 a, a')?.href ?? null,
+    title: c.querySelector('h2 span')?.innerText?.trim() ?? null,
+    company: c.querySelector("[data-testid='company-name']")?.innerText?.trim() ?? null,
+    location: c.querySelector("[data-testid='text-location']")?.innerText?.trim() ?? null
+})).filter(c => c.url)"""
+
+# Detail-page field selectors, walked once per page by the Lexbor parser:
+# the whole tree is built and queried in C, with no Python node objects
+# until a match is read.
+_INDEED_FIELDS = [
+    ("title", "h1.jobsearch-JobInfoHeader-title"),
+    ("company", "div[data-company-name='true']"),
+    ("location", "div[data-testid='inlineHeader-companyLocation']"),
+    ("description", "div#jobDescriptionText"),
+    ("date_posted", "span[data-testid='myJobsStateDate']"),
+    ("salary", "div[data-testid='salary-estimate']"),
+    ("job_type", "div[data-testid='jobType']"),
+    ("company_rating", "div[data-testid='company-rating']"),
+    ("company_reviews_count", "div[data-testid='company-reviews-count']"),
+]
+_COMPANY_WEBSITE_SELECTOR = "a[data-testid='company-website']"
+_BENEFITS_SELECTOR = "div[data-testid='benefits'] li"
+
+# Indeed's job key (jk query parameter), compiled once: the checkpoint
+# skip runs this against every card URL, and a single anchored scan beats
+# a full urlparse + parse_qs per call.
+_JOB_ID_RE = re.compile(r'[?&]jk=([0-9a-fA-F]+)')
+
+# Detail fetches retry transient failures with exponential backoff
+# (0.3s, 0.6s) instead of dropping the job on the first hiccup.
+_DETAIL_FETCH_ATTEMPTS = 3
+_DETAIL_BACKOFF_FACTOR = 0.3
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+class _JobBudget:
+    """Run-wide cap on detail fetches, shared by all page workers.
+
+    Workers claim a slot per candidate card before fetching and refund it
+    when the fetch yields no row, so max_jobs bounds the whole run rather
+    than each page. reserve() and refund() never await, so on asyncio's
+    single thread they need no lock.
+    """
+
+    def __init__(self, limit: Optional[int]):
+        self.limit = limit
+        self.reserved = 0
+
+    def reserve(self) -> bool:
+        """Claim one slot; False once the budget is spent."""
+        if self.limit and self.reserved >= self.limit:
+            return False
+        self.reserved += 1
+        return True
+
+    def refund(self) -> None:
+        """Return a slot claimed for a job that produced no row."""
+        self.reserved -= 1
+
+async def _block_unneeded_resources(route):
+    """Abort requests for resources that contribute nothing to extraction."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or \
+            any(fragment in request.url for fragment in BLOCKED_URL_FRAGMENTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
 class IndeedScraper:
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, max_concurrency: int = 3):
         self.headless = headless
+        self.max_concurrency = max_concurrency
+        self.playwright = None
+        self.browser = None
+        self._loop = None
+        # One site-wide limiter shared by all page workers: 1 request every
+        # 2 seconds in total, regardless of concurrency.
+        self.rate_limiter = AsyncRateLimiter(requests_per_second=0.5)
         load_dotenv()
-        
-    def _random_delay(self, min_seconds: float = 2.0, max_seconds: float = 5.0) -> None:
-        """Add a random delay between requests to be polite."""
-        delay = random.uniform(min_seconds, max_seconds)
-        time.sleep(delay)
-        
-    def _extract_job_data(self, page) -> Dict:
-        """Extract job data from the current job detail page."""
-        try:
-            # Basic job information
-            job_data = {
-                "id": str(uuid.uuid4()),
-                "job_id": page.url.split("/")[-1],  # Extract Indeed's job ID from URL
-                "title": page.query_selector("h1.jobsearch-JobInfoHeader-title").inner_text().strip(),
-                "company": page.query_selector("div[data-company-name='true']").inner_text().strip(),
-                "location": page.query_selector("div[data-testid='inlineHeader-companyLocation']").inner_text().strip(),
-                "description": page.query_selector("div#jobDescriptionText").inner_text().strip(),
-                "url": page.url,
-                "date_posted": page.query_selector("span[data-testid='myJobsStateDate']").inner_text().strip(),
-                "scraped_at": datetime.utcnow()
-            }
-            
-            # Indeed-specific fields
-            try:
-                job_data["salary"] = page.query_selector("div[data-testid='salary-estimate']").inner_text().strip()
-            except:
-                job_data["salary"] = None
-                
-            try:
-                job_data["job_type"] = page.query_selector("div[data-testid='jobType']").inner_text().strip()
-            except:
-                job_data["job_type"] = None
-                
-            try:
-                job_data["company_rating"] = page.query_selector("div[data-testid='company-rating']").inner_text().strip()
-            except:
-                job_data["company_rating"] = None
-                
-            try:
-                job_data["company_reviews_count"] = page.query_selector("div[data-testid='company-reviews-count']").inner_text().strip()
-            except:
-                job_data["company_reviews_count"] = None
-                
-            try:
-                job_data["company_website"] = page.query_selector("a[data-testid='company-website']").get_attribute("href")
-            except:
-                job_data["company_website"] = None
-                
-            # Extract benefits if available
-            benefits = []
-            try:
-                benefits_elements = page.query_selector_all("div[data-testid='benefits'] li")
-                benefits = [benefit.inner_text().strip() for benefit in benefits_elements]
-            except:
-                pass
-            job_data["benefits"] = json.dumps(benefits)
-            
-            # Store complete raw data
-            job_data["raw_data"] = json.dumps({
-                "html": page.content(),
+
+    def __enter__(self):
+        self._run(self._launch_browser())
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _run(self, coro):
+        """Run a coroutine on the scraper's dedicated event loop."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    async def _launch_browser(self) -> None:
+        """Launch Chromium once and reuse it across scrape_jobs calls."""
+        if self.browser is not None:
+            return
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=[
+                '--disable-blink-features=AutomationControlled',
+                '--disable-features=IsolateOrigins,site-per-process',
+                '--disable-site-isolation-trials',
+                '--disable-web-security',
+                '--disable-features=IsolateOrigins',
+                '--disable-site-isolation-trials',
+            ]
+        )
+
+    def close(self) -> None:
+        """Shut down the shared browser and Playwright driver."""
+        if self._loop is None:
+            return
+        self._run(self._close_browser())
+        self._loop.close()
+        self._loop = None
+
+    async def _close_browser(self) -> None:
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def _new_context(self):
+        """Create an isolated browser context with anti-detection settings."""
+        context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+            locale='en-US',
+            timezone_id='America/New_York',
+            geolocation={'latitude': 40.7128, 'longitude': -74.0060},  # New York coordinates
+            permissions=['geolocation']
+        )
+
+        # Add additional headers
+        await context.set_extra_http_headers({
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-User': '?1',
+            'DNT': '1',
+            'Cache-Control': 'max-age=0'
+        })
+
+        # Drop images, fonts, media and trackers; job data is all text and
+        # arrives via document/xhr/fetch responses.
+        await context.route("**/*", _block_unneeded_resources)
+        return context
+
+    @staticmethod
+    def _job_id_from_url(url: str) -> Optional[str]:
+        """Extract Indeed's job key (jk parameter) from a detail-page URL."""
+        match = _JOB_ID_RE.search(url)
+        if match:
+            return match.group(1)
+        return url.split("/")[-1]
+
+    def _extract_from_html(self, html: str, url: str) -> Optional[Dict]:
+        """Extract job data from a detail page's HTML using the module-level
+        selector table."""
+        tree = LexborHTMLParser(html)
+
+        job_data = {}
+        for name, selector in _INDEED_FIELDS:
+            node = tree.css_first(selector)
+            job_data[name] = node.text().strip() if node else None
+
+        if not job_data["title"] or not job_data["company"]:
+            return None
+
+        # The column is a DateTime: resolve "Posted 3 days ago" style text
+        # to a real datetime so rows never hit the insert exception path and
+        # Postgres can index/filter on it.
+        if job_data["date_posted"]:
+            job_data["date_posted"] = dateparser.parse(
+                job_data["date_posted"],
+                settings={"RELATIVE_BASE": datetime.utcnow()},
+            )
+
+        website_el = tree.css_first(_COMPANY_WEBSITE_SELECTOR)
+        benefits = [li.text().strip() for li in tree.css(_BENEFITS_SELECTOR)]
+
+        job_data.update(
+            job_id=self._job_id_from_url(url),
+            url=url,
+            scraped_at=datetime.utcnow(),
+            company_website=website_el.attributes.get("href") if website_el else None,
+            # The columns are JSON(B): hand the driver the structures and
+            # let it serialize once, instead of double-encoding a string
+            # that every reader has to json.loads again.
+            benefits=benefits,
+            raw_data={
                 "metadata": {
                     "scraped_at": datetime.utcnow().isoformat(),
-                    "url": page.url,
+                    "url": url,
                     "title": job_data["title"],
                     "company": job_data["company"]
                 }
-            })
-            
-            return job_data
-            
+            },
+        )
+        return job_data
+
+    async def _fetch_detail(self, context, url: str) -> Optional[Dict]:
+        """Fetch a job detail page over plain HTTP, reusing context cookies.
+
+        The context's request client keeps its TCP+TLS connection to the
+        host alive between calls, so only the first fetch per context pays
+        the handshake. Rate-limit and server errors are retried with
+        backoff; anything else falls through to the rendered fallback.
+        """
+        for attempt in range(_DETAIL_FETCH_ATTEMPTS):
+            try:
+                response = await context.request.get(url)
+            except Exception as e:
+                logger.warning(f"Detail fetch failed for {url}: {str(e)}")
+                response = None
+            if response is not None:
+                if response.ok:
+                    return self._extract_from_html(await response.text(), url)
+                if response.status not in _RETRYABLE_STATUSES:
+                    logger.warning(f"Detail fetch returned {response.status} for {url}")
+                    return None
+            if attempt < _DETAIL_FETCH_ATTEMPTS - 1:
+                await asyncio.sleep(_DETAIL_BACKOFF_FACTOR * (2 ** attempt))
+        return None
+
+    async def _fetch_detail_limited(self, context, url: str, semaphore: asyncio.Semaphore) -> Optional[Dict]:
+        """Rate-limited _fetch_detail wrapped in the per-page fetch cap."""
+        async with semaphore:
+            await self.rate_limiter.acquire()
+            return await self._fetch_detail(context, url)
+
+    async def _extract_job_data(self, page) -> Optional[Dict]:
+        """Extract job data from the current (rendered) job detail page.
+
+        Pulls the DOM once with page.content() and reuses the selector-table
+        extractor, so the rendered fallback and the HTTP path share a
+        single parsing implementation and one CDP round-trip.
+        """
+        try:
+            html = await page.content()
+            return self._extract_from_html(html, page.url)
         except Exception as e:
             logger.error(f"Error extracting job data: {str(e)}")
             return None
 
-    def _save_job(self, job_data: Dict) -> None:
-        """Save job data to the database."""
+    @staticmethod
+    def _existing_job_ids(db) -> set:
+        """Job ids already stored, so a resumed run can skip their fetches.
+
+        One indexed column scan up front replaces a per-card existence
+        query, and the network cost of a re-run drops to O(new jobs).
+        """
+        return set(db.scalars(select(IndeedJob.job_id)))
+
+    def _flush_batch(self, db, batch: List[Dict]) -> None:
+        """Save a batch of job data to the database in a single transaction.
+
+        Duplicate URLs from re-scraped searches are skipped server-side so
+        one duplicate cannot abort the whole batch. The session is owned by
+        the caller and reused across flushes for the whole scrape run.
+        """
+        if not batch:
+            return
         try:
-            db = SessionLocal()
-            job = IndeedJob(**job_data)
-            db.add(job)
+            # executemany form: the driver packs the dicts into multi-row
+            # VALUES pages instead of Python building one giant statement.
+            stmt = insert(IndeedJob).on_conflict_do_nothing(index_elements=['url'])
+            db.execute(stmt, batch)
             db.commit()
-            logger.info(f"Saved job: {job.title} at {job.company}")
+            logger.info(f"Saved batch of {len(batch)} jobs")
         except Exception as e:
-            logger.error(f"Error saving job to database: {str(e)}")
+            logger.error(f"Error saving batch to database: {str(e)}")
             db.rollback()
+
+    async def _db_writer(self, queue: "asyncio.Queue") -> None:
+        """Drain scraped jobs from the queue and flush them in batches.
+
+        Runs alongside the page workers so scraping never blocks on a DB
+        commit; the blocking flush itself happens in the default executor.
+        A None item is the shutdown sentinel.
+        """
+        loop = asyncio.get_running_loop()
+        # One session lives for the whole run: each flush is one transaction
+        # on the same pooled connection instead of a checkout per batch.
+        db = SessionLocal()
+        batch = []
+        done = False
+        try:
+            while not done:
+                flush = False
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=2.0)
+                    if item is None:
+                        done = True
+                    else:
+                        batch.append(item)
+                except asyncio.TimeoutError:
+                    # Idle period: push out whatever has accumulated.
+                    flush = True
+                if batch and (done or flush or len(batch) >= DB_BATCH_SIZE):
+                    await loop.run_in_executor(None, self._flush_batch, db, list(batch))
+                    batch.clear()
         finally:
             db.close()
 
-    def _handle_captcha(self, page) -> bool:
+    async def _handle_captcha(self, page) -> bool:
         """Handle CAPTCHA if present."""
         try:
             # Check for common CAPTCHA indicators
-            captcha_present = page.query_selector("div#captcha-challenge") or \
-                            page.query_selector("div#captcha") or \
-                            page.query_selector("iframe[title*='captcha']")
-            
+            captcha_present = await page.query_selector("div#captcha-challenge") or \
+                            await page.query_selector("div#captcha") or \
+                            await page.query_selector("iframe[title*='captcha']")
+
             if captcha_present:
                 logger.warning("CAPTCHA detected! Please solve it manually.")
                 # Wait for manual intervention
-                page.wait_for_selector("div#captcha-challenge", state="hidden", timeout=120000)
+                await page.wait_for_selector("div#captcha-challenge", state="hidden", timeout=120000)
                 return True
             return False
-        except:
+        except Exception:
             return False
 
-    def scrape_jobs(
+    async def _scrape_page(
         self,
         search_term: str,
         location: str,
-        max_pages: int = 5,
-        max_jobs: Optional[int] = None
+        page_num: int,
+        semaphore: asyncio.Semaphore,
+        budget: _JobBudget,
+        queue: "asyncio.Queue",
+        existing_ids: set
     ) -> List[Dict]:
-        """
-        Scrape job listings from Indeed based on search criteria.
-        
-        Args:
-            search_term: Job title or keywords to search for
-            location: Location to search in
-            max_pages: Maximum number of pages to scrape
-            max_jobs: Maximum number of jobs to scrape (None for no limit)
-            
-        Returns:
-            List of dictionaries containing job data
-        """
-        jobs = []
-        
-        with sync_playwright() as p:
-            # Launch browser with additional configurations
-            browser = p.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-features=IsolateOrigins,site-per-process',
-                    '--disable-site-isolation-trials',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins',
-                    '--disable-site-isolation-trials',
-                ]
-            )
-            
-            # Create a new context with specific viewport and user agent
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-                locale='en-US',
-                timezone_id='America/New_York',
-                geolocation={'latitude': 40.7128, 'longitude': -74.0060},  # New York coordinates
-                permissions=['geolocation']
-            )
-            
-            # Add additional headers
-            context.set_extra_http_headers({
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'DNT': '1',
-                'Cache-Control': 'max-age=0'
-            })
-            
-            page = context.new_page()
-            
+        """Scrape one page of search results in its own browser context."""
+        page_jobs = []
+        async with semaphore:
+            context = await self._new_context()
+            page = await context.new_page()
             try:
-                # Navigate to Indeed
-                search_url = f"https://www.indeed.com/jobs?q={search_term}&l={location}"
+                search_url = (
+                    f"https://www.indeed.com/jobs?q={search_term}&l={location}"
+                    f"&start={page_num * 10}"
+                )
                 logger.info(f"Navigating to: {search_url}")
-                
-                # First visit the homepage
-                page.goto("https://www.indeed.com")
-                self._random_delay(3, 5)
-                
+
+                # First visit the homepage so the context picks up cookies
+                await self.rate_limiter.acquire()
+                await page.goto("https://www.indeed.com")
+
                 # Then navigate to search results
-                page.goto(search_url)
-                self._random_delay(2, 4)
-                
+                await self.rate_limiter.acquire()
+                await page.goto(search_url)
+
                 # Check for CAPTCHA
-                if self._handle_captcha(page):
+                if await self._handle_captcha(page):
                     logger.info("CAPTCHA solved, continuing...")
-                
-                # Save HTML for debugging
-                html_dump_path = os.path.join(os.getcwd(), "indeed_debug.html")
-                with open(html_dump_path, "w", encoding="utf-8") as f:
-                    f.write(page.content())
-                logger.info(f"Saved page HTML to {html_dump_path}")
-                
+
                 # Wait for job cards to load
                 try:
-                    page.wait_for_selector("div.job_seen_beacon", timeout=15000)
+                    await page.wait_for_selector("div.job_seen_beacon", timeout=15000)
                 except TimeoutError:
                     # Try alternative selectors
                     selectors = [
-                        "div.job_seen_beacon",
                         "div[data-testid='job-card']",
                         "div.jobsearch-ResultsList > div",
-                        "div.job_seen_beacon"
                     ]
-                    
                     for selector in selectors:
                         try:
-                            page.wait_for_selector(selector, timeout=5000)
+                            await page.wait_for_selector(selector, timeout=5000)
                             logger.info(f"Found jobs using selector: {selector}")
                             break
                         except TimeoutError:
                             continue
-                
-                for page_num in range(max_pages):
-                    if max_jobs and len(jobs) >= max_jobs:
+
+                # Pull every card's URL and list-level fields in one in-page call
+                cards = await page.evaluate(_CARD_LIST_JS)
+                logger.info(f"Found {len(cards)} jobs on page {page_num + 1}")
+
+                # Pick the cards worth fetching up front...
+                targets = []
+                for card in cards:
+                    url = card["url"]
+                    # Checkpoint skip: anything already in the database (or
+                    # scraped by a sibling worker this run) costs no fetch.
+                    job_id = self._job_id_from_url(url)
+                    if job_id in existing_ids:
+                        logger.debug(f"Skipping already-stored job {job_id}")
+                        continue
+                    # The budget is shared across page workers, so max_jobs
+                    # caps the whole run's fetches, not each page's.
+                    if not budget.reserve():
                         break
-                        
-                    # Get all job cards on the current page
-                    job_cards = page.query_selector_all("div.job_seen_beacon")
-                    if not job_cards:
-                        job_cards = page.query_selector_all("div[data-testid='job-card']")
-                    
-                    logger.info(f"Found {len(job_cards)} jobs on page {page_num + 1}")
-                    
-                    for card in job_cards:
-                        if max_jobs and len(jobs) >= max_jobs:
-                            break
-                            
-                        try:
-                            # Click the job card to load details
-                            card.click()
-                            self._random_delay()
-                            
-                            # Wait for job details to load
-                            page.wait_for_selector("h1.jobsearch-JobInfoHeader-title", timeout=5000)
-                            
-                            # Extract job data
-                            job_data = self._extract_job_data(page)
-                            if job_data:
-                                jobs.append(job_data)
-                                self._save_job(job_data)
-                                logger.info(f"Scraped job: {job_data['title']} at {job_data['company']}")
-                            
-                        except Exception as e:
-                            logger.error(f"Error processing job card: {str(e)}")
-                            continue
-                    
-                    # Click next page if not on last page
-                    if page_num < max_pages - 1:
-                        try:
-                            next_button = page.query_selector("a[data-testid='pagination-page-next']")
-                            if next_button and next_button.is_enabled():
-                                next_button.click()
-                                self._random_delay(2, 4)
-                                # Wait for new page to load
-                                page.wait_for_selector("div.job_seen_beacon", timeout=10000)
-                            else:
-                                logger.info("No more pages available")
-                                break
-                        except Exception as e:
-                            logger.error(f"Error navigating to next page: {str(e)}")
-                            break
-                
+                    targets.append((url, job_id))
+
+                # ...then fetch their detail pages concurrently: the pages
+                # are independent, so the HTTPS round-trips overlap instead
+                # of queueing behind each other. The same markup is rendered
+                # server-side and each request shares the context's cookies
+                # and CAPTCHA state.
+                detail_semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+                results = await asyncio.gather(
+                    *[
+                        self._fetch_detail_limited(context, url, detail_semaphore)
+                        for url, _ in targets
+                    ],
+                    return_exceptions=True
+                )
+
+                # zip keeps results in card order regardless of completion
+                for (url, job_id), job_data in zip(targets, results):
+                    if isinstance(job_data, Exception):
+                        logger.error(f"Error processing job card: {str(job_data)}")
+                        budget.refund()
+                        continue
+
+                    try:
+                        if job_data is None:
+                            # Fall back to a full render when the static
+                            # response lacks the job content. Serial: the
+                            # worker has one rendering page.
+                            await page.goto(url)
+                            await page.wait_for_selector("h1.jobsearch-JobInfoHeader-title", timeout=5000)
+                            job_data = await self._extract_job_data(page)
+
+                        if job_data:
+                            existing_ids.add(job_id)
+                            page_jobs.append(job_data)
+                            await queue.put(job_data)
+                            logger.info(f"Scraped job: {job_data['title']} at {job_data['company']}")
+                        else:
+                            # Reserved but yielded no row: free the slot so
+                            # another card can use it.
+                            budget.refund()
+
+                    except Exception as e:
+                        logger.error(f"Error processing job card: {str(e)}")
+                        budget.refund()
+                        continue
+
             except Exception as e:
-                logger.error(f"Error during scraping: {str(e)}")
-            
+                logger.error(f"Error scraping page {page_num + 1}: {str(e)}")
+
             finally:
-                browser.close()
-                
+                await context.close()
+
+        return page_jobs
+
+    async def scrape_jobs_async(
+        self,
+        search_term: str,
+        location: str,
+        max_pages: int = 5,
+        max_jobs: Optional[int] = None
+    ) -> List[Dict]:
+        """Scrape search result pages concurrently, one context per page."""
+        await self._launch_browser()
+        jobs = []
+
+        # Load the checkpoint before any navigation: the set is shared by
+        # all page workers and grows as they scrape.
+        db = SessionLocal()
+        try:
+            existing_ids = self._existing_job_ids(db)
+        finally:
+            db.close()
+
+        # Page workers produce into the queue; a single writer task drains
+        # it in batches so DB latency stays off the scraping critical path.
+        queue = asyncio.Queue(maxsize=5000)
+        writer = asyncio.create_task(self._db_writer(queue))
+
+        # One budget across all page workers, so max_jobs caps the run.
+        budget = _JobBudget(max_jobs)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        try:
+            results = await asyncio.gather(
+                *[
+                    self._scrape_page(search_term, location, page_num, semaphore, budget, queue, existing_ids)
+                    for page_num in range(max_pages)
+                ],
+                return_exceptions=True
+            )
+
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error during scraping: {str(result)}")
+                    continue
+                for job_data in result:
+                    if max_jobs and len(jobs) >= max_jobs:
+                        break
+                    jobs.append(job_data)
+        finally:
+            await queue.put(None)
+            await writer
+
         return jobs
 
+    def scrape_jobs(
+        self,
+        search_term: str,
+        location: str,
+        max_pages: int = 5,
+        max_jobs: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Scrape job listings from Indeed based on search criteria.
+
+        Args:
+            search_term: Job title or keywords to search for
+            location: Location to search in
+            max_pages: Maximum number of pages to scrape
+            max_jobs: Maximum number of jobs to scrape (None for no limit)
+
+        Returns:
+            List of dictionaries containing job data
+        """
+        return self._run(
+            self.scrape_jobs_async(search_term, location, max_pages, max_jobs)
+        )
+
 if __name__ == "__main__":
     # Example usage
-    scraper = IndeedScraper(headless=True)
-    jobs = scraper.scrape_jobs(
-        search_term="python developer",
-        location="United States",
-        max_pages=2,
-        max_jobs=10
-    )
-    
+    with IndeedScraper(headless=True) as scraper:
+        jobs = scraper.scrape_jobs(
+            search_term="python developer",
+            location="United States",
+            max_pages=2,
+            max_jobs=10
+        )
+
     print(f"Scraped {len(jobs)} jobs")
     for job in jobs:
         print(f"\nTitle: {job['title']}")
         print(f"Company: {job['company']}")
         print(f"Location: {job['location']}")
         print(f"Posted: {job['date_posted']}")
-        print("-" * 50) 
\ No newline at end of file
+        print("-" * 50)
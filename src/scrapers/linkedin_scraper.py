@@ -5,8 +5,9 @@ import logging
 from typing import List, Dict, Optional
 from datetime import datetime
 import os
+import dateparser
 from dotenv import load_dotenv
-import uuid
+from sqlalchemy.dialects.postgresql import insert
 from database.models import Job, SessionLocal
 
 # Configure logging
@@ -16,46 +17,117 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of jobs to accumulate before flushing to the database. Keeps memory
+# bounded while amortizing transaction overhead across many rows.
+DB_BATCH_SIZE = 1000
+
+# Resource types and tracker domains the scraper never consumes; aborting
+# them cuts page-load time and bandwidth without affecting extraction.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+BLOCKED_URL_FRAGMENTS = ("googletagmanager", "doubleclick", "google-analytics", "segment.io")
+
+# Single in-page extractor for the job detail pane: one CDP round-trip, with
+# optional chaining turning missing elements into nulls instead of exceptions.
+_DETAIL_PANE_JS = """() => {
+    const t = sel => document.querySelector(sel)?.innerText?.trim() ?? null;
+    return {
+        title: t('.job-details-jobs-unified-top-card__job-title'),
+        company: t('.job-details-jobs-unified-top-card__company-name'),
+        location: t('.job-details-jobs-unified-top-card__bullet'),
+        date_posted: t('.job-details-jobs-unified-top-card__posted-date'),
+        description: t('.job-details-jobs-unified-top-card__job-description')
+    };
+}"""
+
+def _block_unneeded_resources(route):
+    """Abort requests for resources that contribute nothing to extraction."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or \
+            any(fragment in request.url for fragment in BLOCKED_URL_FRAGMENTS):
+        route.abort()
+    else:
+        route.continue_()
+
 class LinkedInScraper:
     def __init__(self, headless: bool = True):
         self.headless = headless
+        self.playwright = None
+        self.browser = None
         load_dotenv()
-        
+
+    def __enter__(self):
+        self._launch_browser()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _launch_browser(self) -> None:
+        """Launch Chromium once and reuse it across scrape_jobs calls."""
+        if self.browser is not None:
+            return
+        self.playwright = sync_playwright().start()
+        self.browser = self.playwright.chromium.launch(
+            headless=self.headless,
+            args=[
+                '--disable-blink-features=AutomationControlled',
+                '--disable-features=IsolateOrigins,site-per-process',
+            ]
+        )
+
+    def close(self) -> None:
+        """Shut down the shared browser and Playwright driver."""
+        if self.browser:
+            self.browser.close()
+            self.browser = None
+        if self.playwright:
+            self.playwright.stop()
+            self.playwright = None
+
     def _random_delay(self, min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
         """Add a random delay between requests to be polite."""
         delay = random.uniform(min_seconds, max_seconds)
         time.sleep(delay)
         
-    def _extract_job_data(self, page) -> Dict:
+    def _extract_job_data(self, page) -> Optional[Dict]:
         """Extract job data from the current job detail page."""
         try:
-            return {
-                "id": str(uuid.uuid4()),
-                "title": page.query_selector(".job-details-jobs-unified-top-card__job-title").inner_text().strip(),
-                "company": page.query_selector(".job-details-jobs-unified-top-card__company-name").inner_text().strip(),
-                "location": page.query_selector(".job-details-jobs-unified-top-card__bullet").inner_text().strip(),
-                "date_posted": page.query_selector(".job-details-jobs-unified-top-card__posted-date").inner_text().strip(),
-                "description": page.query_selector(".job-details-jobs-unified-top-card__job-description").inner_text().strip(),
-                "url": page.url,
-                "scraped_at": datetime.utcnow()
-            }
+            data = page.evaluate(_DETAIL_PANE_JS)
+            if not data["title"] or not data["company"]:
+                logger.warning(f"Missing required fields on {page.url}")
+                return None
+            # The column is a DateTime: resolve "2 weeks ago" style text to
+            # a real datetime before the batch insert, so one raw string
+            # can't make the whole batch roll back.
+            if data["date_posted"]:
+                data["date_posted"] = dateparser.parse(
+                    data["date_posted"],
+                    settings={"RELATIVE_BASE": datetime.utcnow()},
+                )
+            return dict(data, url=page.url, scraped_at=datetime.utcnow())
         except Exception as e:
             logger.error(f"Error extracting job data: {str(e)}")
             return None
 
-    def _save_job(self, job_data: Dict) -> None:
-        """Save job data to the database."""
+    def _flush_batch(self, db, batch: List[Dict]) -> None:
+        """Save a batch of job data to the database in a single transaction.
+
+        Duplicate URLs from re-scraped searches are skipped server-side so
+        one duplicate cannot abort the whole batch. The session is owned by
+        the caller and reused across flushes for the whole scrape run.
+        """
+        if not batch:
+            return
         try:
-            db = SessionLocal()
-            job = Job(**job_data)
-            db.add(job)
+            # executemany form: the driver packs the dicts into multi-row
+            # VALUES pages instead of Python building one giant statement.
+            stmt = insert(Job).on_conflict_do_nothing(index_elements=['url'])
+            db.execute(stmt, batch)
             db.commit()
-            logger.info(f"Saved job: {job.title} at {job.company}")
+            logger.info(f"Saved batch of {len(batch)} jobs")
         except Exception as e:
-            logger.error(f"Error saving job to database: {str(e)}")
+            logger.error(f"Error saving batch to database: {str(e)}")
             db.rollback()
-        finally:
-            db.close()
 
     def scrape_jobs(
         self,
@@ -76,115 +148,119 @@ class LinkedInScraper:
         Returns:
             List of dictionaries containing job data
         """
+        self._launch_browser()
         jobs = []
-        
-        with sync_playwright() as p:
-            # Launch browser with additional configurations
-            browser = p.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-features=IsolateOrigins,site-per-process',
-                ]
-            )
-            
-            # Create a new context with specific viewport and user agent
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
-            )
-            
-            # Add additional headers
-            context.set_extra_http_headers({
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'DNT': '1'
-            })
-            
-            page = context.new_page()
+        pending = []
+        # One session for the whole run; flushes reuse the same connection.
+        db = SessionLocal()
+
+        # Create a new context with specific viewport and user agent
+        context = self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+        )
+
+        # Add additional headers
+        context.set_extra_http_headers({
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-User': '?1',
+            'DNT': '1'
+        })
+
+        # Drop images, fonts, media and trackers; job data is all text and
+        # arrives via document/xhr/fetch responses.
+        context.route("**/*", _block_unneeded_resources)
+
+        page = context.new_page()
             
-            try:
-                # Navigate to LinkedIn Jobs
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={search_term}&location={location}"
-                logger.info(f"Navigating to: {search_url}")
-                page.goto(search_url)
-                self._random_delay(2, 4)
+        try:
+            # Navigate to LinkedIn Jobs
+            search_url = f"https://www.linkedin.com/jobs/search/?keywords={search_term}&location={location}"
+            logger.info(f"Navigating to: {search_url}")
+            page.goto(search_url)
+            self._random_delay(2, 4)
                 
-                # Wait for job cards to load
-                page.wait_for_selector(".job-card-container", timeout=10000)
+            # Wait for job cards to load
+            page.wait_for_selector(".job-card-container", timeout=10000)
                 
-                for page_num in range(max_pages):
-                    if max_jobs and len(jobs) >= max_jobs:
-                        break
+            for page_num in range(max_pages):
+                if max_jobs and len(jobs) >= max_jobs:
+                    break
                         
-                    # Get all job cards on the current page
-                    job_cards = page.query_selector_all(".job-card-container")
-                    logger.info(f"Found {len(job_cards)} jobs on page {page_num + 1}")
+                # Get all job cards on the current page
+                job_cards = page.query_selector_all(".job-card-container")
+                logger.info(f"Found {len(job_cards)} jobs on page {page_num + 1}")
                     
-                    for card in job_cards:
-                        if max_jobs and len(jobs) >= max_jobs:
-                            break
+                for card in job_cards:
+                    if max_jobs and len(jobs) >= max_jobs:
+                        break
                             
-                        try:
-                            # Click the job card to load details
-                            card.click()
-                            self._random_delay()
+                    try:
+                        # Click the job card to load details
+                        card.click()
+                        self._random_delay()
                             
-                            # Wait for job details to load
-                            page.wait_for_selector(".job-details-jobs-unified-top-card__job-title", timeout=5000)
+                        # Wait for job details to load
+                        page.wait_for_selector(".job-details-jobs-unified-top-card__job-title", timeout=5000)
                             
-                            # Extract job data
-                            job_data = self._extract_job_data(page)
-                            if job_data:
-                                jobs.append(job_data)
-                                self._save_job(job_data)
-                                logger.info(f"Scraped job: {job_data['title']} at {job_data['company']}")
+                        # Extract job data
+                        job_data = self._extract_job_data(page)
+                        if job_data:
+                            jobs.append(job_data)
+                            pending.append(job_data)
+                            if len(pending) >= DB_BATCH_SIZE:
+                                self._flush_batch(db, pending)
+                                pending.clear()
+                            logger.info(f"Scraped job: {job_data['title']} at {job_data['company']}")
                             
-                        except Exception as e:
-                            logger.error(f"Error processing job card: {str(e)}")
-                            continue
+                    except Exception as e:
+                        logger.error(f"Error processing job card: {str(e)}")
+                        continue
                     
-                    # Click next page if not on last page
-                    if page_num < max_pages - 1:
-                        try:
-                            next_button = page.query_selector(".artdeco-pagination__button--next")
-                            if next_button and next_button.is_enabled():
-                                next_button.click()
-                                self._random_delay(2, 4)
-                                # Wait for new page to load
-                                page.wait_for_selector(".job-card-container", timeout=10000)
-                            else:
-                                logger.info("No more pages available")
-                                break
-                        except Exception as e:
-                            logger.error(f"Error navigating to next page: {str(e)}")
+                # Click next page if not on last page
+                if page_num < max_pages - 1:
+                    try:
+                        next_button = page.query_selector(".artdeco-pagination__button--next")
+                        if next_button and next_button.is_enabled():
+                            next_button.click()
+                            self._random_delay(2, 4)
+                            # Wait for new page to load
+                            page.wait_for_selector(".job-card-container", timeout=10000)
+                        else:
+                            logger.info("No more pages available")
                             break
+                    except Exception as e:
+                        logger.error(f"Error navigating to next page: {str(e)}")
+                        break
                 
-            except Exception as e:
-                logger.error(f"Error during scraping: {str(e)}")
-            
-            finally:
-                browser.close()
-                
+        except Exception as e:
+            logger.error(f"Error during scraping: {str(e)}")
+
+        finally:
+            self._flush_batch(db, pending)
+            pending.clear()
+            db.close()
+            context.close()
+
         return jobs
 
 if __name__ == "__main__":
     # Example usage
-    scraper = LinkedInScraper(headless=True)
-    jobs = scraper.scrape_jobs(
-        search_term="python developer",
-        location="United States",
-        max_pages=2,
-        max_jobs=10
-    )
-    
+    with LinkedInScraper(headless=True) as scraper:
+        jobs = scraper.scrape_jobs(
+            search_term="python developer",
+            location="United States",
+            max_pages=2,
+            max_jobs=10
+        )
+
     print(f"Scraped {len(jobs)} jobs")
     for job in jobs:
         print(f"\nTitle: {job['title']}")
@@ -11,8 +11,7 @@ logger = logging.getLogger(__name__)
 
 def view_recent_jobs():
     """View the most recently scraped jobs."""
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         jobs = db.query(IndeedJob).order_by(IndeedJob.scraped_at.desc()).limit(10).all()
         if jobs:
             logger.info(f"\nFound {len(jobs)} most recent jobs:")
@@ -25,8 +24,6 @@ def view_recent_jobs():
                 logger.info("-" * 50)
         else:
             logger.info("No jobs found in database.")
-    finally:
-        db.close()
 
 def main():
     # Initialize scraper with headless=False to see the browser
@@ -1,5 +1,5 @@
 from scrapers.linkedin_scraper import LinkedInScraper
-import json
+import orjson
 from datetime import datetime
 from database.models import SessionLocal, Job
 import logging
@@ -12,58 +12,58 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 def main():
-    # Initialize the scraper
-    scraper = LinkedInScraper(headless=True)
-    
     # Test parameters
     search_term = "python developer"
     location = "United States"
     max_pages = 2
     max_jobs = 10
-    
+
     logger.info(f"Starting scrape for '{search_term}' in {location}")
     logger.info(f"Max pages: {max_pages}, Max jobs: {max_jobs}")
     logger.info("-" * 50)
-    
+
     # Run the scraper
-    jobs = scraper.scrape_jobs(
-        search_term=search_term,
-        location=location,
-        max_pages=max_pages,
-        max_jobs=max_jobs
-    )
-    
-    # Print results
+    with LinkedInScraper(headless=True) as scraper:
+        jobs = scraper.scrape_jobs(
+            search_term=search_term,
+            location=location,
+            max_pages=max_pages,
+            max_jobs=max_jobs
+        )
+
+    # Print results as one JSON summary instead of four log calls per job
     logger.info(f"\nScraped {len(jobs)} jobs")
-    for job in jobs:
-        logger.info(f"\nTitle: {job['title']}")
-        logger.info(f"Company: {job['company']}")
-        logger.info(f"Location: {job['location']}")
-        logger.info(f"Posted: {job['date_posted']}")
-        logger.info("-" * 50)
-    
-    # Save results to file
+    if jobs:
+        summary = [
+            {
+                'title': job['title'],
+                'company': job['company'],
+                'location': job['location'],
+                'date_posted': job['date_posted'],
+            }
+            for job in jobs
+        ]
+        logger.info(orjson.dumps(summary, option=orjson.OPT_INDENT_2, default=str).decode())
+
+    # Save results to file; orjson emits bytes directly
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"jobs_{timestamp}.json"
-    
-    with open(filename, 'w') as f:
-        json.dump(jobs, f, indent=2)
-    
+
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(jobs, default=str))
+
     logger.info(f"\nResults saved to {filename}")
-    
-    # Verify database entries
-    db = SessionLocal()
-    try:
-        db_jobs = db.query(Job).all()
-        logger.info(f"\nFound {len(db_jobs)} jobs in database")
-        for job in db_jobs:
-            logger.info(f"\nTitle: {job.title}")
-            logger.info(f"Company: {job.company}")
-            logger.info(f"Location: {job.location}")
-            logger.info(f"Posted: {job.date_posted}")
-            logger.info("-" * 50)
-    finally:
-        db.close()
+
+    # Verify only this run's rows landed: an unfiltered query would drag
+    # every historical job out of the database just to log it.
+    scraped_urls = {job['url'] for job in jobs if job.get('url')}
+    if not scraped_urls:
+        logger.info("No jobs scraped; skipping database verification")
+        return
+
+    with SessionLocal() as db:
+        db_count = db.query(Job).filter(Job.url.in_(scraped_urls)).count()
+        logger.info(f"\nFound {db_count} of this run's {len(scraped_urls)} jobs in database")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
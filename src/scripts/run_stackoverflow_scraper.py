@@ -1,6 +1,9 @@
 from ..scrapers.stackoverflow_scraper import StackOverflowScraper
 from ..database.models import StackOverflowJob, ScrapingMetrics, SessionLocal
+from ..utils.monitoring import flush_metrics
 from datetime import datetime, timedelta
+import argparse
+import asyncio
 import logging
 
 # Configure logging
@@ -12,8 +15,7 @@ logger = logging.getLogger(__name__)
 
 def view_scraping_metrics():
     """View the most recent scraping metrics from the database."""
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         # Get the most recent metrics
         metrics = db.query(ScrapingMetrics)\
             .order_by(ScrapingMetrics.created_at.desc())\
@@ -39,14 +41,10 @@ def view_scraping_metrics():
                     logger.info(f"- {error['type']}: {error['message']}")
         else:
             logger.info("No scraping metrics found in the database.")
-            
-    finally:
-        db.close()
 
 def view_recent_jobs():
     """View the most recently scraped jobs."""
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         # Get jobs from the last hour
         one_hour_ago = datetime.utcnow() - timedelta(hours=1)
         jobs = db.query(StackOverflowJob)\
@@ -65,21 +63,62 @@ def view_recent_jobs():
                 logger.info(f"URL: {job.url}")
         else:
             logger.info("No jobs found in the last hour.")
-            
+
+async def crawl_many(terms, concurrency: int = 3):
+    """Scrape many (search_term, location) pairs over one shared browser.
+
+    Each pair runs in its own browser context; the semaphore caps how many
+    run at once so a long term list doesn't open unbounded tabs.
+
+    Args:
+        terms: Iterable of (search_term, location) pairs
+        concurrency: Maximum number of pairs scraped concurrently
+
+    Returns:
+        Flat list of job dicts across all pairs
+    """
+    scraper = StackOverflowScraper(headless=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def scrape_one(search_term, location):
+        async with semaphore:
+            return await scraper.scrape_jobs_async(
+                search_term=search_term,
+                location=location,
+                max_pages=2,
+                max_jobs=10
+            )
+
+    try:
+        results = await asyncio.gather(
+            *[scrape_one(term, location) for term, location in terms]
+        )
     finally:
-        db.close()
+        await scraper.aclose()
+
+    return [job for result in results for job in result]
 
 def main():
-    # Initialize and run the scraper
-    scraper = StackOverflowScraper(headless=False)
-    jobs = scraper.scrape_jobs(
-        search_term="Python Developer",
-        location="New York, NY",
-        max_pages=2,
-        max_jobs=10
+    parser = argparse.ArgumentParser(description="Run the Stack Overflow jobs scraper")
+    parser.add_argument(
+        '--terms', nargs='+', default=["Python Developer"],
+        help="Search terms to scrape (each becomes its own crawl)"
     )
-    
-    # View the results
+    parser.add_argument('--location', default="New York, NY", help="Location to search in")
+    parser.add_argument(
+        '--concurrency', type=int, default=3,
+        help="How many search terms to scrape concurrently"
+    )
+    args = parser.parse_args()
+
+    jobs = asyncio.run(
+        crawl_many([(term, args.location) for term in args.terms], concurrency=args.concurrency)
+    )
+    logger.info(f"Scraped {len(jobs)} jobs across {len(args.terms)} search terms")
+
+    # View the results, once the background writer has committed this
+    # run's metrics row
+    flush_metrics()
     logger.info("\n=== Scraping Results ===")
     view_scraping_metrics()
     view_recent_jobs()
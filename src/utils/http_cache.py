@@ -0,0 +1,51 @@
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+class HttpCache:
+    """SQLite-backed store for static HTTP responses.
+
+    Repeated test runs re-issue identical GETs against the live sites;
+    replaying the bodies from disk makes second-and-later runs bound by
+    parsing instead of the network. Entries expire after expire_after
+    seconds so a stale page can't hide a selector change for long.
+    """
+
+    def __init__(self, path: str = "test_http_cache.sqlite", expire_after: float = 3600.0):
+        self.path = path
+        self.expire_after = expire_after
+        # One shared connection guarded by a lock: the scrapers fetch from
+        # executor threads, and sqlite connections are not thread-safe.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, body TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the cached body for url, or None on miss or expiry."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, fetched_at = row
+        if time.time() - fetched_at > self.expire_after:
+            return None
+        return body
+
+    def put(self, url: str, body: str) -> None:
+        """Store (or refresh) the body for url."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (url, body, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
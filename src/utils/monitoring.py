@@ -1,17 +1,63 @@
+import atexit
 import time
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 import logging
 from dataclasses import dataclass, field
-import json
+from pathlib import Path
+import orjson
 import os
+import queue
+import threading
 from database.models import ScrapingMetrics, SessionLocal
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Fire-and-forget metrics persistence: save_metrics enqueues the row and
+# returns immediately; the daemon thread below pays the DB round-trip.
+_metrics_queue = queue.Queue()
+_writer_thread = None
+
+def _metrics_writer():
+    while True:
+        db_metrics = _metrics_queue.get()
+        try:
+            with SessionLocal() as db:
+                db.add(db_metrics)
+                db.commit()
+                logger.info(f"Saved metrics to database with ID: {db_metrics.id}")
+        except Exception as e:
+            logger.error(f"Error saving metrics to database: {str(e)}")
+        finally:
+            _metrics_queue.task_done()
+
+def _ensure_writer_thread():
+    """Start the daemon writer thread on first use."""
+    global _writer_thread
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(
+            target=_metrics_writer, name="metrics-writer", daemon=True
+        )
+        _writer_thread.start()
+
+def flush_metrics():
+    """Block until every queued metrics row has been written.
+
+    Callers that read metrics back right after a scrape need this, and
+    the atexit registration below keeps interpreter shutdown from
+    dropping rows the daemon thread hasn't committed yet.
+    """
+    _metrics_queue.join()
+
+atexit.register(flush_metrics)
+
+@dataclass(slots=True)
 class ScrapingMetricsData:
-    """Data class to store scraping metrics."""
+    """Data class to store scraping metrics.
+
+    slots=True keeps counter bumps off the per-instance __dict__; these
+    fields are incremented in the scrapers' tight loops.
+    """
     start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
     total_jobs_found: int = 0
@@ -21,13 +67,15 @@ class ScrapingMetricsData:
     total_requests: int = 0
     failed_requests: int = 0
     total_duration: float = 0.0
-    errors: List[Dict] = field(default_factory=list)
+    errors: List[Tuple] = field(default_factory=list)
     
     def to_dict(self) -> Dict:
         """Convert metrics to dictionary."""
         return {
-            'start_time': self.start_time.isoformat(),
-            'end_time': self.end_time.isoformat() if self.end_time else None,
+            # datetimes stay as objects; orjson serializes them natively at
+            # dump time without a per-field isoformat pass.
+            'start_time': self.start_time,
+            'end_time': self.end_time,
             'total_jobs_found': self.total_jobs_found,
             'total_jobs_scraped': self.total_jobs_scraped,
             'total_jobs_saved': self.total_jobs_saved,
@@ -40,16 +88,23 @@ class ScrapingMetricsData:
         }
 
 class ScraperMonitor:
-    def __init__(self, scraper_name: str):
+    def __init__(self, scraper_name: str, directory: str = "metrics"):
         """
         Initialize the scraper monitor.
-        
+
         Args:
             scraper_name: Name of the scraper being monitored
+            directory: Where save_metrics writes its JSON files
         """
         self.scraper_name = scraper_name
+        self.directory = directory
+        # Filled in by save_metrics; lets callers check the latest write
+        # without globbing an ever-growing metrics directory.
+        self.last_written_path: Optional[Path] = None
         self.metrics = ScrapingMetricsData()
         self.start_time = time.time()
+        # Anchor for resolving monotonic error offsets to wall-clock time.
+        self._mono_start = time.monotonic()
         
     def record_job_found(self):
         """Record that a job was found."""
@@ -64,14 +119,31 @@ class ScraperMonitor:
         self.metrics.total_jobs_saved += 1
         
     def record_job_failed(self, error: Exception):
-        """Record a failed job scrape."""
+        """Record a failed job scrape.
+
+        Stores a (monotonic, type, message) tuple; the wall-clock timestamp
+        is reconstructed at serialization time so the hot failure path never
+        pays for datetime.now().isoformat().
+        """
         self.metrics.failed_jobs += 1
-        self.metrics.errors.append({
-            'timestamp': datetime.now().isoformat(),
-            'type': type(error).__name__,
-            'message': str(error)
-        })
+        self.metrics.errors.append(
+            (time.monotonic(), type(error).__name__, str(error))
+        )
         
+    def _resolve_errors(self) -> List[Dict]:
+        """Materialize error tuples into dicts with wall-clock timestamps."""
+        return [
+            {
+                'timestamp': (
+                    self.metrics.start_time
+                    + timedelta(seconds=mono - self._mono_start)
+                ).isoformat(),
+                'type': error_type,
+                'message': message,
+            }
+            for mono, error_type, message in self.metrics.errors
+        ]
+
     def record_request(self, success: bool = True):
         """Record a request attempt."""
         self.metrics.total_requests += 1
@@ -83,46 +155,44 @@ class ScraperMonitor:
         self.metrics.end_time = datetime.now()
         self.metrics.total_duration = time.time() - self.start_time
         
-    def save_metrics(self, directory: str = "metrics"):
+    def save_metrics(self, directory: Optional[str] = None):
         """Save metrics to both JSON file and database."""
         self.finish()
         metrics_dict = self.metrics.to_dict()
-        
+        metrics_dict['errors'] = self._resolve_errors()
+
         # Save to JSON file
+        directory = directory or self.directory
         os.makedirs(directory, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{directory}/{self.scraper_name}_{timestamp}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(metrics_dict, f, indent=2)
-            
+        # orjson emits bytes directly and is far faster than the stdlib
+        # encoder; the file is machine-read, so no indentation.
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(metrics_dict, option=orjson.OPT_NAIVE_UTC))
+
+        self.last_written_path = Path(filename)
         logger.info(f"Saved metrics to {filename}")
         
-        # Save to database
-        try:
-            db = SessionLocal()
-            db_metrics = ScrapingMetrics(
-                scraper_name=self.scraper_name,
-                start_time=self.metrics.start_time,
-                end_time=self.metrics.end_time,
-                total_jobs_found=self.metrics.total_jobs_found,
-                total_jobs_scraped=self.metrics.total_jobs_scraped,
-                total_jobs_saved=self.metrics.total_jobs_saved,
-                failed_jobs=self.metrics.failed_jobs,
-                total_requests=self.metrics.total_requests,
-                failed_requests=self.metrics.failed_requests,
-                total_duration=self.metrics.total_duration,
-                success_rate=metrics_dict['success_rate'],
-                errors=self.metrics.errors
-            )
-            db.add(db_metrics)
-            db.commit()
-            logger.info(f"Saved metrics to database with ID: {db_metrics.id}")
-        except Exception as e:
-            logger.error(f"Error saving metrics to database: {str(e)}")
-            db.rollback()
-        finally:
-            db.close()
+        # Queue for the background DB writer; metrics are fire-and-forget
+        # so shutdown doesn't block on a database round-trip.
+        db_metrics = ScrapingMetrics(
+            scraper_name=self.scraper_name,
+            start_time=self.metrics.start_time,
+            end_time=self.metrics.end_time,
+            total_jobs_found=self.metrics.total_jobs_found,
+            total_jobs_scraped=self.metrics.total_jobs_scraped,
+            total_jobs_saved=self.metrics.total_jobs_saved,
+            failed_jobs=self.metrics.failed_jobs,
+            total_requests=self.metrics.total_requests,
+            failed_requests=self.metrics.failed_requests,
+            total_duration=self.metrics.total_duration,
+            success_rate=metrics_dict['success_rate'],
+            errors=metrics_dict['errors']
+        )
+        _ensure_writer_thread()
+        _metrics_queue.put(db_metrics)
             
     def log_summary(self):
         """Log a summary of the scraping session."""
@@ -1,18 +1,52 @@
+import asyncio
+import threading
 import time
 import random
-from datetime import datetime, timedelta
+from collections import deque
 from typing import Optional
+from urllib.parse import urlparse
 import logging
 
 logger = logging.getLogger(__name__)
 
+class AsyncRateLimiter:
+    """Deadline-based rate limiter for concurrent async workers.
+
+    Hands out evenly spaced request slots so N workers together never
+    exceed the configured site-wide rate, instead of each worker sleeping
+    a random interval serially.
+    """
+
+    def __init__(self, requests_per_second: float = 0.5):
+        """
+        Initialize the async rate limiter.
+
+        Args:
+            requests_per_second: Site-wide request rate shared by all workers
+        """
+        self._interval = 1.0 / requests_per_second
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until the next request slot is available."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = max(0.0, self._next_slot - now)
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            logger.debug(f"Rate limiter: waiting {wait:.2f} seconds")
+            await asyncio.sleep(wait)
+
 class RateLimiter:
     def __init__(
         self,
         min_delay: float = 1.0,
         max_delay: float = 3.0,
         max_requests_per_minute: int = 30,
-        burst_size: int = 5
+        burst_size: int = 5,
+        clock=time.monotonic,
+        sleep=time.sleep
     ):
         """
         Initialize the rate limiter.
@@ -22,21 +56,33 @@ class RateLimiter:
             max_delay: Maximum delay between requests in seconds
             max_requests_per_minute: Maximum number of requests allowed per minute
             burst_size: Number of requests allowed in burst mode
+            clock: Monotonic time source (injectable so tests can fake time)
+            sleep: Sleep function paired with the clock
         """
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.max_requests_per_minute = max_requests_per_minute
         self.burst_size = burst_size
+        self._clock = clock
+        self._sleep = sleep
         
-        self.request_timestamps = []
+        # Monotonic floats in a deque: expiry pops from the left in O(k)
+        # instead of rebuilding a list of datetime objects on every wait.
+        # The maxlen bound keeps a long-lived limiter's footprint constant
+        # and still comfortably exceeds any minute window worth counting.
+        self.request_timestamps = deque(maxlen=max(100, max_requests_per_minute))
         self.last_request_time = None
         self.consecutive_failures = 0
         self.burst_mode = False
+        # Serializes slot assignment in wait(): callers run on executor
+        # threads, so the bookkeeping must advance atomically per claim.
+        self._lock = threading.Lock()
         
     def _clean_old_timestamps(self):
         """Remove timestamps older than 1 minute."""
-        one_minute_ago = datetime.now() - timedelta(minutes=1)
-        self.request_timestamps = [ts for ts in self.request_timestamps if ts > one_minute_ago]
+        cutoff = self._clock() - 60.0
+        while self.request_timestamps and self.request_timestamps[0] < cutoff:
+            self.request_timestamps.popleft()
         
     def _calculate_delay(self) -> float:
         """Calculate the delay needed before the next request."""
@@ -48,8 +94,9 @@ class RateLimiter:
             
         # If we've hit the rate limit, wait until we can make another request
         if len(self.request_timestamps) >= self.max_requests_per_minute:
-            oldest_timestamp = min(self.request_timestamps)
-            wait_time = 60 - (datetime.now() - oldest_timestamp).total_seconds()
+            # The deque is append-ordered, so the head is the oldest entry.
+            oldest_timestamp = self.request_timestamps[0]
+            wait_time = 60 - (self._clock() - oldest_timestamp)
             if wait_time > 0:
                 return wait_time
                 
@@ -57,14 +104,27 @@ class RateLimiter:
         return random.uniform(self.min_delay, self.max_delay)
         
     def wait(self):
-        """Wait for the appropriate amount of time before making the next request."""
-        if self.last_request_time:
-            delay = self._calculate_delay()
+        """Wait for the appropriate amount of time before making the next request.
+
+        The next slot is claimed under the lock and the sleep happens
+        outside it (the pattern AsyncRateLimiter.acquire uses), so
+        concurrent threads each get a distinct, spaced slot instead of all
+        reading the same last_request_time and firing together.
+        """
+        with self._lock:
+            now = self._clock()
+            # Explicit None check: a monotonic clock may legitimately read 0.0
+            if self.last_request_time is None:
+                slot = now
+            else:
+                slot = max(now, self.last_request_time) + self._calculate_delay()
+            self.last_request_time = slot
+            self.request_timestamps.append(slot)
+
+        delay = slot - now
+        if delay > 0:
             logger.debug(f"Rate limiter: waiting {delay:.2f} seconds")
-            time.sleep(delay)
-            
-        self.last_request_time = datetime.now()
-        self.request_timestamps.append(self.last_request_time)
+            self._sleep(delay)
         
     def record_success(self):
         """Record a successful request."""
@@ -82,7 +142,42 @@ class RateLimiter:
             
     def reset(self):
         """Reset the rate limiter state."""
-        self.consecutive_failures = 0
-        self.burst_mode = False
-        self.request_timestamps = []
-        self.last_request_time = None 
\ No newline at end of file
+        with self._lock:
+            self.consecutive_failures = 0
+            self.burst_mode = False
+            self.request_timestamps.clear()
+            self.last_request_time = None
+
+class DomainRateLimiter:
+    """Process-wide rate limiting budgeted per domain.
+
+    Scrapers share one instance but each domain draws from its own
+    RateLimiter, so concurrent work against different hosts interleaves
+    freely while two scrapers hitting the same host split one budget
+    instead of doubling the load.
+    """
+
+    def __init__(self):
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def limiter_for(self, url: str, **limiter_kwargs) -> RateLimiter:
+        """Return the limiter owning url's domain, creating it on first use.
+
+        limiter_kwargs configure a domain's limiter the first time that
+        domain is seen; later callers get the existing one unchanged.
+        """
+        domain = urlparse(url).netloc
+        with self._lock:
+            limiter = self._limiters.get(domain)
+            if limiter is None:
+                limiter = RateLimiter(**limiter_kwargs)
+                self._limiters[domain] = limiter
+        return limiter
+
+    def wait(self, url: str) -> None:
+        """Wait for the next request slot on url's domain."""
+        self.limiter_for(url).wait()
+
+# One limiter shared by every scraper in the process.
+GLOBAL_LIMITER = DomainRateLimiter() 
\ No newline at end of file
@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Point the models at a throwaway SQLite file unless the environment says
+# otherwise, so a fresh clone can run the default suite without a Postgres
+# server. Must happen before anything imports database.models, which builds
+# its engine (and creates tables) at import time; pytest-xdist workers get
+# their own per-worker file via the suffix logic in models.py.
+os.environ.setdefault('DATABASE_URL', 'sqlite:///test_headhunter.sqlite')
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the on-disk HTTP cache and always hit the network.',
+    )
+
+@pytest.fixture(autouse=True, scope='session')
+def http_cache(request):
+    """Replay static HTTP fetches from a local SQLite cache.
+
+    Dev loops re-run the suite dozens of times against the same pages;
+    with the cache installed only the first run pays for the network.
+    Nightly runs pass --no-cache to exercise the live sites.
+    """
+    if request.config.getoption('--no-cache'):
+        yield None
+        return
+
+    from scrapers.stackoverflow_scraper import HttpxEngine
+    from utils.http_cache import HttpCache
+
+    cache = HttpCache('test_http_cache.sqlite', expire_after=3600.0)
+    HttpxEngine.default_cache = cache
+    yield cache
+    HttpxEngine.default_cache = None
+    cache.close()
@@ -1,54 +1,81 @@
 import unittest
-import sys
-import os
+import asyncio
 from datetime import datetime
-import json
+from unittest import mock
 
-# Add the src directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
+from sqlalchemy.orm import Session
 
-from scrapers.indeed_scraper import IndeedScraper
-from database.models import IndeedJob, SessionLocal
+# The src path comes from conftest.py; scraper and model imports are
+# deferred into the tests so collection doesn't pay for Playwright or an
+# engine connection.
 
+# Minimal detail-page markup covering the fields the extractor reads;
+# keeps the parsing tests off the network entirely.
+_DETAIL_HTML = """
+<html><body>
+  <h1 class="jobsearch-JobInfoHeader-title">Python Developer</h1>
+  <div data-company-name="true">Acme Corp</div>
+  <div data-testid="inlineHeader-companyLocation">New York, NY</div>
+  <div id="jobDescriptionText">Build scrapers.</div>
+  <div data-testid="benefits"><ul><li>401k</li><li>Health</li></ul></div>
+</body></html>
+"""
+
+@pytest.mark.integration
 class TestIndeedScraper(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        """Set up test environment before running tests."""
+        """Set up test environment and run the one shared scrape.
+
+        Scraping dominates suite time, so a single live scrape feeds every
+        assertion-only test below; both the returned jobs and the rows they
+        produced in the database are cached at class level.
+        """
+        from scrapers.indeed_scraper import IndeedScraper
+        from database.models import IndeedJob, SessionLocal, engine
+
         cls.scraper = IndeedScraper(headless=True)
         cls.test_search_term = "python developer"
         cls.test_location = "United States"
-        
-    def setUp(self):
-        """Set up before each test."""
-        # Clear the database before each test
+
+        # Start from a clean table so the cached DB snapshot is exactly
+        # this scrape's output. Drop-and-recreate is O(1) DDL; a DELETE
+        # journals every historical row first.
+        IndeedJob.__table__.drop(engine, checkfirst=True)
+        IndeedJob.__table__.create(engine)
+
+        cls._jobs = cls.scraper.scrape_jobs(
+            search_term=cls.test_search_term,
+            location=cls.test_location,
+            max_pages=2,
+            max_jobs=4
+        )
+
         db = SessionLocal()
-        db.query(IndeedJob).delete()
-        db.commit()
+        cls._db_jobs = db.query(IndeedJob).all()
         db.close()
-        
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.scraper.close()
+
     def test_scraper_initialization(self):
         """Test if scraper initializes correctly."""
         self.assertIsNotNone(self.scraper)
         self.assertTrue(self.scraper.headless)
-        
+
     def test_basic_scraping(self):
         """Test basic scraping functionality."""
-        # Scrape a small number of jobs
-        jobs = self.scraper.scrape_jobs(
-            search_term=self.test_search_term,
-            location=self.test_location,
-            max_pages=1,
-            max_jobs=2
-        )
-        
+        jobs = self._jobs
+
         # Verify jobs were scraped
         self.assertIsInstance(jobs, list)
-        self.assertLessEqual(len(jobs), 2)
-        
+        self.assertLessEqual(len(jobs), 4)
+
         if jobs:
             # Verify job data structure
             job = jobs[0]
-            self.assertIn('id', job)
             self.assertIn('title', job)
             self.assertIn('company', job)
             self.assertIn('location', job)
@@ -56,7 +83,7 @@ class TestIndeedScraper(unittest.TestCase):
             self.assertIn('url', job)
             self.assertIn('date_posted', job)
             self.assertIn('scraped_at', job)
-            
+
             # Verify Indeed-specific fields
             self.assertIn('job_id', job)
             self.assertIn('salary', job)
@@ -66,22 +93,14 @@ class TestIndeedScraper(unittest.TestCase):
             self.assertIn('company_website', job)
             self.assertIn('benefits', job)
             self.assertIn('raw_data', job)
-            
+
     def test_database_saving(self):
         """Test if jobs are being saved to the database."""
-        # Scrape one job
-        self.scraper.scrape_jobs(
-            search_term=self.test_search_term,
-            location=self.test_location,
-            max_pages=1,
-            max_jobs=1
-        )
-        
-        # Verify job was saved to database
-        db = SessionLocal()
-        saved_jobs = db.query(IndeedJob).all()
-        db.close()
-        
+        # Rows snapshotted from the shared scrape in setUpClass
+        saved_jobs = self._db_jobs
+
+        from database.models import IndeedJob
+
         self.assertGreater(len(saved_jobs), 0)
         if saved_jobs:
             job = saved_jobs[0]
@@ -89,31 +108,21 @@ class TestIndeedScraper(unittest.TestCase):
             self.assertIsNotNone(job.id)
             self.assertIsNotNone(job.title)
             self.assertIsNotNone(job.company)
-            
+
     def test_raw_data_storage(self):
         """Test if raw data is being stored correctly."""
-        # Scrape one job
-        self.scraper.scrape_jobs(
-            search_term=self.test_search_term,
-            location=self.test_location,
-            max_pages=1,
-            max_jobs=1
-        )
-        
-        # Verify raw data
-        db = SessionLocal()
-        job = db.query(IndeedJob).first()
-        db.close()
-        
+        job = self._db_jobs[0] if self._db_jobs else None
+
         if job:
-            raw_data = json.loads(job.raw_data)
-            self.assertIn('html', raw_data)
+            # The JSON column deserializes on load; no per-row parse here
+            raw_data = job.raw_data
+            self.assertNotIn('html', raw_data)
             self.assertIn('metadata', raw_data)
             self.assertIn('scraped_at', raw_data['metadata'])
             self.assertIn('url', raw_data['metadata'])
             self.assertIn('title', raw_data['metadata'])
             self.assertIn('company', raw_data['metadata'])
-            
+
     def test_error_handling(self):
         """Test error handling with invalid search terms."""
         # Test with empty search term
@@ -124,7 +133,7 @@ class TestIndeedScraper(unittest.TestCase):
             max_jobs=1
         )
         self.assertIsInstance(jobs, list)
-        
+
         # Test with invalid location
         jobs = self.scraper.scrape_jobs(
             search_term=self.test_search_term,
@@ -133,25 +142,129 @@ class TestIndeedScraper(unittest.TestCase):
             max_jobs=1
         )
         self.assertIsInstance(jobs, list)
-        
-    def test_rate_limiting(self):
-        """Test if rate limiting is working."""
-        import time
-        start_time = time.time()
-        
-        # Scrape multiple pages
-        self.scraper.scrape_jobs(
-            search_term=self.test_search_term,
-            location=self.test_location,
-            max_pages=2,
-            max_jobs=4
+
+class TestIndeedScraperUnit(unittest.TestCase):
+    """Offline tests: parsing, rate limiting and checkpointing run against
+    synthetic data, so the default (non-integration) suite never touches
+    the network or launches a browser."""
+
+    @classmethod
+    def setUpClass(cls):
+        # One connection serves all test-local DB work, wrapped in an outer
+        # transaction that tearDownClass rolls back. Each test gets a session
+        # on this connection inside a savepoint, so teardown is a rollback
+        # instead of a DELETE plus commit fsync per test.
+        from database.models import engine
+
+        cls.connection = engine.connect()
+        cls._outer_txn = cls.connection.begin()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._outer_txn.rollback()
+        cls.connection.close()
+
+    def setUp(self):
+        self.nested = self.connection.begin_nested()
+        self.session = Session(bind=self.connection)
+
+    def tearDown(self):
+        self.session.close()
+        self.nested.rollback()
+
+    def test_extract_from_html(self):
+        """Test field extraction from a synthetic detail page."""
+        from scrapers.indeed_scraper import IndeedScraper
+
+        scraper = IndeedScraper(headless=True)
+        url = 'https://www.indeed.com/viewjob?jk=abc123'
+        job_data = scraper._extract_from_html(_DETAIL_HTML, url)
+
+        self.assertIsNotNone(job_data)
+        self.assertEqual(job_data['title'], 'Python Developer')
+        self.assertEqual(job_data['company'], 'Acme Corp')
+        self.assertEqual(job_data['location'], 'New York, NY')
+        self.assertEqual(job_data['description'], 'Build scrapers.')
+        self.assertEqual(job_data['job_id'], 'abc123')
+        self.assertEqual(job_data['url'], url)
+        self.assertEqual(job_data['benefits'], ['401k', 'Health'])
+        self.assertIn('metadata', job_data['raw_data'])
+
+    def test_extract_from_html_missing_required(self):
+        """Pages without title and company yield no row."""
+        from scrapers.indeed_scraper import IndeedScraper
+
+        scraper = IndeedScraper(headless=True)
+        self.assertIsNone(
+            scraper._extract_from_html('<html><body></body></html>', 'https://www.indeed.com/x')
         )
-        
-        end_time = time.time()
-        duration = end_time - start_time
-        
-        # Verify that scraping took at least 8 seconds (2 pages * 4 seconds minimum delay)
-        self.assertGreaterEqual(duration, 8)
+
+    def test_resume_skip_existing(self):
+        """Test that stored job ids are picked up for checkpoint skipping.
+
+        Runs against this test's savepoint session, so the seeded row
+        vanishes on teardown.
+        """
+        from scrapers.indeed_scraper import IndeedScraper
+        from database.models import IndeedJob
+
+        self.session.add(IndeedJob(
+            job_id='resume-test-1',
+            title='Test Title',
+            company='Test Company',
+            url='https://www.indeed.com/viewjob?jk=resume-test-1',
+        ))
+        self.session.flush()
+
+        existing = IndeedScraper._existing_job_ids(self.session)
+        self.assertIn('resume-test-1', existing)
+
+    def test_max_jobs_budget_shared(self):
+        """max_jobs slots are drawn from one run-wide pool and refundable."""
+        from scrapers.indeed_scraper import _JobBudget
+
+        budget = _JobBudget(3)
+        # Two "workers" draw from the same pool
+        self.assertTrue(budget.reserve())
+        self.assertTrue(budget.reserve())
+        self.assertTrue(budget.reserve())
+        self.assertFalse(budget.reserve())
+
+        # A failed fetch hands its slot back
+        budget.refund()
+        self.assertTrue(budget.reserve())
+        self.assertFalse(budget.reserve())
+
+        # No limit means the budget never runs out
+        unlimited = _JobBudget(None)
+        for _ in range(100):
+            self.assertTrue(unlimited.reserve())
+
+    def test_rate_limiting(self):
+        """Test if rate limiting spaces requests at the configured rate.
+
+        The limiter's sleeps are captured instead of actually slept, so the
+        test asserts on the requested delay without burning wall-clock time.
+        """
+        from utils.rate_limiter import AsyncRateLimiter
+
+        requested = []
+
+        async def exercise():
+            limiter = AsyncRateLimiter(requests_per_second=0.5)
+
+            async def fake_sleep(delay):
+                requested.append(delay)
+
+            with mock.patch('utils.rate_limiter.asyncio.sleep', side_effect=fake_sleep):
+                for _ in range(5):
+                    await limiter.acquire()
+
+        asyncio.run(exercise())
+
+        # Five acquisitions at one request per 2 seconds must ask for at
+        # least 8 seconds of combined delay (the first slot is free).
+        self.assertGreaterEqual(sum(requested), 8)
 
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
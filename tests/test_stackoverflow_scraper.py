@@ -1,19 +1,12 @@
 import unittest
-import sys
-import os
 import logging
-from datetime import datetime
-import json
-import time
-from pathlib import Path
+import tempfile
 
-# Add the src directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
 
-from scrapers.stackoverflow_scraper import StackOverflowScraper
-from database.models import StackOverflowJob, SessionLocal
-from utils.rate_limiter import RateLimiter
-from utils.monitoring import ScraperMonitor
+# The src path comes from conftest.py; scraper and model imports are
+# deferred into the tests so collection doesn't pay for Playwright or an
+# engine connection.
 
 # Configure logging
 logging.basicConfig(
@@ -22,30 +15,69 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Minimal server-rendered result page for the offline extraction test;
+# padded past the static-shell threshold the scraper rejects.
+_STATIC_RESULT_HTML = """
+<html><body><ul id="job-list">
+  <li><div data-jobkey="key-1">
+    <h2 class="chakra-text">Data Scientist</h2>
+    <p class="css-a2ofi8">Acme Corp</p>
+    <p class="css-tbx6ua">New York, NY</p>
+    <span class="chakra-badge">$150k - $180k</span>
+    <span class="chakra-badge">Full-time</span>
+    <p class="css-ewn64s">3 days ago</p>
+  </div></li>
+</ul></body></html>
+""" + ' ' * 2048
+
+class FakeClock:
+    """Simulated monotonic clock for exercising rate limiters offline."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.slept.append(delay)
+        self.now += delay
+
 class TestStackOverflowScraper(unittest.TestCase):
-    def setUp(self):
-        """Set up test environment."""
-        self.scraper = StackOverflowScraper(headless=False)
-        self.test_search_term = "Data Scientist"
-        self.test_location = "New York, NY"
-        self.max_pages = 2
-        self.max_jobs = 10
-
-    def tearDown(self):
-        """Clean up after tests."""
-        if self.scraper.browser:
-            self.scraper.browser.close()
-        if self.scraper.playwright:
-            self.scraper.playwright.stop()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a shared scraper for the whole class.
+
+        The httpx engine serves statically rendered result pages without a
+        browser; Chromium only launches (lazily, and then stays alive for
+        the rest of the class) if a scrape has to fall back to rendering.
+        """
+        from scrapers.stackoverflow_scraper import StackOverflowScraper
+
+        cls.scraper = StackOverflowScraper(headless=True, engine='httpx')
+        cls.test_search_term = "Data Scientist"
+        cls.test_location = "New York, NY"
+        cls.max_pages = 2
+        cls.max_jobs = 10
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down the shared browser once after all tests."""
+        cls.scraper.close()
 
     def test_scraper_initialization(self):
         """Test if the scraper initializes correctly."""
+        from utils.rate_limiter import RateLimiter
+        from utils.monitoring import ScraperMonitor
+
         self.assertIsNotNone(self.scraper)
         self.assertEqual(self.scraper.base_url, "https://stackoverflowjobs.com")
-        self.assertFalse(self.scraper.headless)
+        self.assertTrue(self.scraper.headless)
         self.assertIsInstance(self.scraper.rate_limiter, RateLimiter)
         self.assertIsInstance(self.scraper.monitor, ScraperMonitor)
 
+    @pytest.mark.integration
     def test_basic_scraping(self):
         """Test basic scraping functionality."""
         jobs = self.scraper.scrape_jobs(
@@ -68,12 +100,16 @@ class TestStackOverflowScraper(unittest.TestCase):
             self.assertIn('date_posted', job)
             self.assertIn('raw_data', job)
 
+    @pytest.mark.integration
     def test_database_saving(self):
         """Test if jobs are saved to the database correctly."""
-        # First, clear existing test data
+        from database.models import StackOverflowJob, SessionLocal, engine
+
+        # First, clear existing test data. Drop-and-recreate is O(1) DDL;
+        # a DELETE journals every historical row first.
+        StackOverflowJob.__table__.drop(engine, checkfirst=True)
+        StackOverflowJob.__table__.create(engine)
         db = SessionLocal()
-        db.query(StackOverflowJob).delete()
-        db.commit()
         
         # Scrape some jobs
         jobs = self.scraper.scrape_jobs(
@@ -83,10 +119,20 @@ class TestStackOverflowScraper(unittest.TestCase):
             max_jobs=5
         )
         
-        # Check if jobs were saved to database
-        saved_jobs = db.query(StackOverflowJob).all()
+        # Check if jobs were saved to database. Only the asserted columns
+        # are fetched: pulling full entities would drag every row's
+        # description and raw_data blobs through SQLite just to look at ids.
+        saved_jobs = db.query(
+            StackOverflowJob.id,
+            StackOverflowJob.job_id,
+            StackOverflowJob.title,
+            StackOverflowJob.company,
+            StackOverflowJob.location,
+            StackOverflowJob.url,
+            StackOverflowJob.date_posted,
+        ).all()
         self.assertLessEqual(len(saved_jobs), 5)
-        
+
         if saved_jobs:
             job = saved_jobs[0]
             self.assertIsNotNone(job.id)
@@ -94,13 +140,16 @@ class TestStackOverflowScraper(unittest.TestCase):
             self.assertIsNotNone(job.title)
             self.assertIsNotNone(job.company)
             self.assertIsNotNone(job.location)
-            self.assertIsNotNone(job.description)
             self.assertIsNotNone(job.url)
             self.assertIsNotNone(job.date_posted)
-            self.assertIsNotNone(job.raw_data)
-        
+
+            # One targeted fetch covers the blob column
+            raw_data = db.query(StackOverflowJob.raw_data).first()
+            self.assertIsNotNone(raw_data[0])
+
         db.close()
 
+    @pytest.mark.integration
     def test_error_handling(self):
         """Test error handling with invalid inputs."""
         # Test with invalid search term
@@ -121,28 +170,111 @@ class TestStackOverflowScraper(unittest.TestCase):
         )
         self.assertIsInstance(jobs, list)
 
+    def test_static_extraction(self):
+        """Test card extraction from a synthetic static result page."""
+        jobs = self.scraper._extract_jobs_static(_STATIC_RESULT_HTML)
+
+        self.assertIsNotNone(jobs)
+        self.assertEqual(len(jobs), 1)
+        job = jobs[0]
+        self.assertEqual(job['job_id'], 'key-1')
+        self.assertEqual(job['title'], 'Data Scientist')
+        self.assertEqual(job['company'], 'Acme Corp')
+        self.assertEqual(job['location'], 'New York, NY')
+        self.assertEqual(job['salary_range'], '$150k - $180k')
+        self.assertEqual(job['job_type'], 'Full-time')
+
+        # A client-side shell must signal the browser fallback
+        self.assertIsNone(self.scraper._extract_jobs_static('<html></html>'))
+
     def test_rate_limiting(self):
-        """Test if rate limiting is working."""
-        start_time = datetime.now()
-        
-        jobs = self.scraper.scrape_jobs(
-            search_term=self.test_search_term,
-            location=self.test_location,
-            max_pages=2,
-            max_jobs=10
+        """Test if rate limiting is working, on a fake clock.
+
+        The limiter takes its clock and sleep as constructor arguments, so
+        the test advances simulated time instead of really sleeping.
+        """
+        from utils.rate_limiter import RateLimiter
+
+        clock = FakeClock()
+        limiter = RateLimiter(
+            min_delay=1.0,
+            max_delay=3.0,
+            max_requests_per_minute=30,
+            burst_size=5,
+            clock=clock,
+            sleep=clock.sleep
         )
-        
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
-        
-        # Check if scraping took at least 2 seconds (due to rate limiting)
-        self.assertGreaterEqual(duration, 2)
-        
+
+        for _ in range(5):
+            limiter.wait()
+
+        # Four delayed requests at min_delay >= 1s each
+        self.assertGreaterEqual(sum(clock.slept), 2)
+
         # Check if rate limiter is tracking requests
-        self.assertGreater(self.scraper.rate_limiter.request_timestamps, 0)
+        self.assertGreater(len(limiter.request_timestamps), 0)
+
+    def test_rate_limiting_thread_safety(self):
+        """Concurrent waiters must claim distinct, spaced request slots.
+
+        The scrapers run wait() on executor threads, so simultaneous
+        callers must not all read the same last request time and fire
+        together.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from utils.rate_limiter import RateLimiter
+
+        clock = FakeClock()
+        limiter = RateLimiter(
+            min_delay=1.0,
+            max_delay=1.0,
+            clock=clock,
+            sleep=clock.sleep
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for future in [pool.submit(limiter.wait) for _ in range(8)]:
+                future.result()
+
+        slots = list(limiter.request_timestamps)
+        self.assertEqual(len(slots), 8)
+        for earlier, later in zip(slots, slots[1:]):
+            self.assertGreaterEqual(later - earlier, 0.999)
+
+    def test_domain_rate_limiting(self):
+        """Test that domains draw from independent rate budgets.
+
+        The first request to each domain is free, so interleaved traffic
+        against two hosts must only sleep when a host repeats.
+        """
+        from utils.rate_limiter import DomainRateLimiter
+
+        clock = FakeClock()
+        shared = DomainRateLimiter()
+        kwargs = dict(min_delay=1.0, max_delay=1.0, clock=clock, sleep=clock.sleep)
 
+        shared.limiter_for('https://a.example/jobs', **kwargs)
+        shared.limiter_for('https://b.example/jobs', **kwargs)
+        self.assertIsNot(
+            shared.limiter_for('https://a.example/jobs'),
+            shared.limiter_for('https://b.example/jobs'),
+        )
+
+        shared.wait('https://a.example/jobs')
+        shared.wait('https://b.example/jobs')
+        self.assertEqual(clock.slept, [])
+
+        # A repeat against the first domain pays that domain's delay only.
+        shared.wait('https://a.example/jobs?page=2')
+        self.assertEqual(len(clock.slept), 1)
+
+    @pytest.mark.integration
     def test_monitoring(self):
         """Test if monitoring is working correctly."""
+        # Write into a throwaway directory so repeated runs don't grow the
+        # repo's metrics/ dir
+        self.scraper.monitor.directory = tempfile.mkdtemp()
+
         jobs = self.scraper.scrape_jobs(
             search_term=self.test_search_term,
             location=self.test_location,
@@ -158,11 +290,10 @@ class TestStackOverflowScraper(unittest.TestCase):
         self.assertGreaterEqual(metrics.total_jobs_scraped, 0)
         self.assertGreaterEqual(metrics.total_jobs_saved, 0)
         
-        # Check if metrics file was created
-        metrics_dir = Path("metrics")
-        self.assertTrue(metrics_dir.exists())
-        metrics_files = list(metrics_dir.glob("stackoverflow_scraper_*.json"))
-        self.assertGreater(len(metrics_files), 0)
+        # Check if the metrics file was created: the monitor remembers its
+        # last write, so no directory glob over every past run's files
+        self.assertIsNotNone(self.scraper.monitor.last_written_path)
+        self.assertTrue(self.scraper.monitor.last_written_path.exists())
 
     def test_rate_limiter_adaptive_delay(self):
         """Test if rate limiter adapts to failures."""